@@ -2,6 +2,18 @@ import datetime
 from zoneinfo import ZoneInfo
 from google.adk.agents import Agent
 
+_WEATHER_REPORTS = {
+    "new york": (
+        "The weather in New York is sunny with a temperature of 25 degrees"
+        " Celsius (77 degrees Fahrenheit)."
+    ),
+}
+
+_CITY_TIMEZONES = {
+    "new york": "America/New_York",
+}
+
+
 def get_weather(city: str) -> dict:
     """Retrieves the current weather report for a specified city.
 
@@ -11,19 +23,13 @@ def get_weather(city: str) -> dict:
     Returns:
         dict: status and result or error msg.
     """
-    if city.lower() == "new york":
-        return {
-            "status": "success",
-            "report": (
-                "The weather in New York is sunny with a temperature of 25 degrees"
-                " Celsius (77 degrees Fahrenheit)."
-            ),
-        }
-    else:
+    report = _WEATHER_REPORTS.get(city.strip().casefold())
+    if report is None:
         return {
             "status": "error",
             "error_message": f"Weather information for '{city}' is not available.",
         }
+    return {"status": "success", "report": report}
 
 
 def get_current_time(city: str) -> dict:
@@ -36,9 +42,8 @@ def get_current_time(city: str) -> dict:
         dict: status and result or error msg.
     """
 
-    if city.lower() == "new york":
-        tz_identifier = "America/New_York"
-    else:
+    tz_identifier = _CITY_TIMEZONES.get(city.strip().casefold())
+    if tz_identifier is None:
         return {
             "status": "error",
             "error_message": (